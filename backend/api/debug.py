@@ -43,6 +43,7 @@ async def reprocess_od_cd(
             status="completed"
         )
         await db.commit()
+        db_service.invalidate_papers_summary(paper_id)
         
         # 統計結果
         successful_count = sum(1 for r in od_cd_results if r.get("detection_status") == "success")
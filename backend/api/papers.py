@@ -7,6 +7,7 @@ from dataclasses import asdict
 
 from ..core.database import get_db
 from ..services.db_service import db_service
+from ..services.unified_query_service import unified_query_processor
 from ..services.queue_service import queue_service
 from ..core.logging import get_logger
 from ..models.paper import (
@@ -113,6 +114,7 @@ async def toggle_paper_selection(
         success = await db_service.set_paper_selection(
             db, paper_id, selection_data.is_selected
         )
+        unified_query_processor.invalidate_workspace()
         
         # 記錄處理時間
         processing_time = time.time() - start_time
@@ -147,6 +149,7 @@ async def select_all_papers(db: AsyncSession = Depends(get_db)):
     """全選所有論文"""
     try:
         success = await db_service.select_all_papers(db)
+        unified_query_processor.invalidate_workspace()
         if success:
             return {"success": True, "message": "已全選所有論文"}
         else:
@@ -161,6 +164,7 @@ async def deselect_all_papers(db: AsyncSession = Depends(get_db)):
     """取消全選"""
     try:
         success = await db_service.deselect_all_papers(db)
+        unified_query_processor.invalidate_workspace()
         if success:
             return {"success": True, "message": "已取消全選"}
         else:
@@ -238,6 +242,7 @@ async def batch_select_papers(
             except Exception as e:
                 failed_papers.append(paper_id)
                 logger.warning(f"設置論文 {paper_id} 選取狀態失敗: {e}")
+        unified_query_processor.invalidate_workspace()
         
         # 記錄處理時間
         processing_time = time.time() - start_time
@@ -397,9 +402,6 @@ async def process_unified_query(
         if not selected_papers:
             raise ValidationException("請先選取要查詢的論文")
         
-        # 導入統一查詢處理器
-        from ..services.unified_query_service import unified_query_processor
-        
         # 獲取論文資料
         papers_data = []
         for paper in selected_papers:
@@ -643,7 +645,6 @@ async def test_unified_query(
             })
         
         # 3. 生成論文摘要 (簡化版本)
-        from ..services.unified_query_service import unified_query_processor
         papers_summary = await unified_query_processor._generate_papers_summary(papers_data, db)
         
         return {
@@ -13,6 +13,7 @@ from ..models.user import User, Workspace
 from ..models.paper import PaperCreate, PaperResponse
 from ..services.file_service import file_service
 from ..services.db_service import db_service
+from ..services.unified_query_service import unified_query_processor
 from ..services.queue_service import TaskPriority
 from ..core.logging import get_logger
 from ..core.pagination import PaginationParams, create_pagination_params, paginate_query, PaginatedResponse
@@ -79,6 +80,7 @@ async def upload_file_to_workspace(
         
         # 6. 自動選取新上傳的論文
         await db_service.mark_paper_selected(db, paper_id)
+        unified_query_processor.invalidate_workspace(workspace_id)
         
         # 7. 使用正式的處理服務
         from ..services.processing_service import processing_service
@@ -186,6 +188,7 @@ async def upload_multiple_files_to_workspace(
                 
                 # 6. 自動選取新上傳的論文
                 await db_service.mark_paper_selected(db, paper_id)
+                unified_query_processor.invalidate_workspace(workspace_id)
                 
                 # 7. 使用processing_service處理檔案
                 from ..services.processing_service import processing_service
@@ -468,6 +471,7 @@ async def select_all_workspace_files(
     """
     try:
         count = await db_service.select_all_papers_in_workspace(db, workspace_id)
+        unified_query_processor.invalidate_workspace(workspace_id)
         return {
             "success": True,
             "message": f"已選取工作區內 {count} 個檔案",
@@ -493,6 +497,7 @@ async def deselect_all_workspace_files(
     """
     try:
         count = await db_service.deselect_all_papers_in_workspace(db, workspace_id)
+        unified_query_processor.invalidate_workspace(workspace_id)
         return {
             "success": True,
             "message": f"已取消選取工作區內 {count} 個檔案",
@@ -562,6 +567,7 @@ async def delete_workspace_file(
         
         # 刪除檔案記錄和實體檔案
         await db_service.delete_paper(db, file_id)
+        unified_query_processor.invalidate_workspace(workspace_id)
         await file_service.delete_workspace_file(paper.file_hash, workspace_id)
         
         return {"success": True, "message": "檔案刪除成功"}
@@ -610,6 +616,7 @@ async def toggle_workspace_file_selection(
         else:
             await db_service.mark_paper_unselected(db, file_id)
             message = f"檔案 {paper.original_filename} 已取消選取"
+        unified_query_processor.invalidate_workspace(workspace_id)
         
         return {
             "success": True,
@@ -643,6 +650,7 @@ async def batch_select_workspace_files(
     """
     try:
         count = await db_service.batch_select_papers_in_workspace(db, file_ids, workspace_id)
+        unified_query_processor.invalidate_workspace(workspace_id)
         return {
             "success": True,
             "message": f"已選取 {count} 個檔案",
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict, Any, List, Optional
 from uuid import UUID
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from ..core.database import get_db
 from ..api.dependencies import get_workspace_for_user, get_current_user
@@ -23,14 +23,14 @@ class QueryRequest(BaseModel):
     query: str
     defining_types: Optional[List[str]] = None
     keywords: Optional[List[str]] = None
-    max_results: Optional[int] = 100
+    max_results: Optional[int] = Field(100, ge=1)  # 直接作為資料庫 LIMIT，必須為正數
 
 class UnifiedQueryRequest(BaseModel):
     query: str
     search_scope: Optional[str] = "selected"  # "selected", "all", "specific"
     specific_paper_ids: Optional[List[str]] = None
     include_sections: Optional[List[str]] = None  # 指定要搜尋的章節類型
-    max_results: Optional[int] = 100
+    max_results: Optional[int] = Field(100, ge=1)  # 直接作為資料庫 LIMIT，必須為正數
 
 # ===== 查詢端點 =====
 
@@ -68,13 +68,11 @@ async def process_workspace_query(
             db, 
             workspace_id,
             defining_types=query_data.defining_types,
-            keywords=query_data.keywords
+            keywords=query_data.keywords,
+            paper_ids=paper_ids,
+            limit=query_data.max_results
         )
         
-        # 限制結果數量
-        if query_data.max_results and len(search_results) > query_data.max_results:
-            search_results = search_results[:query_data.max_results]
-        
         return {
             "success": True,
             "message": f"在工作區內找到 {len(search_results)} 個相關句子",
@@ -168,12 +166,10 @@ async def unified_workspace_query(
             logger.error(f"統一查詢服務調用失敗: {str(e)}")
             # 回退到基本搜尋
             search_results = await db_service.search_sentences_in_workspace(
-                db, workspace_id, keywords=[query_data.query]
+                db, workspace_id, keywords=[query_data.query], paper_ids=paper_ids,
+                limit=query_data.max_results
             )
             
-            if query_data.max_results and len(search_results) > query_data.max_results:
-                search_results = search_results[:query_data.max_results]
-            
             return {
                 "success": True,
                 "message": f"基本查詢完成，找到 {len(search_results)} 個結果",
@@ -238,12 +234,9 @@ async def test_workspace_query(
         if query_data.query and selected_papers:
             paper_ids = [str(paper.id) for paper in selected_papers]
             test_results = await db_service.search_sentences_in_workspace(
-                db, workspace_id, keywords=[query_data.query]
+                db, workspace_id, keywords=[query_data.query], paper_ids=paper_ids,
+                limit=5  # 限制測試結果數量
             )
-            
-            # 限制測試結果數量
-            if len(test_results) > 5:
-                test_results = test_results[:5]
         
         return {
             "success": True,
@@ -28,6 +28,15 @@ class Settings(BaseSettings):
     postgres_db: str = os.getenv("POSTGRES_DB", "paper_analysis")
     postgres_user: str = os.getenv("POSTGRES_USER", "postgres")
     postgres_password: str = os.getenv("POSTGRES_PASSWORD", "password")
+    # asyncpg 每個連線的預備語句快取數量，重複查詢可直接重用已解析的執行計畫
+    db_prepared_statement_cache_size: int = int(os.getenv("DB_PREPARED_STATEMENT_CACHE_SIZE", "500"))
+    # 連線池設定：查詢流程會並行提取多個章節，每個任務各自取用一條連線
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "20"))
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    db_pool_timeout: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    db_pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    # SQLAlchemy 編譯後 SQL 的快取數量，查詢形狀種類多於預設的 500 時避免重新編譯
+    db_query_cache_size: int = int(os.getenv("DB_QUERY_CACHE_SIZE", "1200"))
     
     # 相容性別名
     @property
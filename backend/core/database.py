@@ -13,9 +13,14 @@ async_engine = create_async_engine(
     settings.async_database_url,
     echo=settings.debug,
     pool_pre_ping=True,
-    pool_recycle=3600,
-    pool_size=10,
-    max_overflow=20
+    pool_recycle=settings.db_pool_recycle,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    query_cache_size=settings.db_query_cache_size,
+    connect_args={
+        "prepared_statement_cache_size": settings.db_prepared_statement_cache_size
+    }
 )
 
 # 建立AsyncSession工廠
@@ -5,19 +5,31 @@
 
 import asyncio
 import aiohttp
-import json
 import time
 from typing import Dict, Any, Optional, Union, List
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import hashlib
 from urllib.parse import urljoin
+import orjson
 
 from .config import settings
 from .logging import get_logger
 
 logger = get_logger("http_client")
 
+def _json_loads(content: Union[str, bytes]) -> Any:
+    """以 orjson 解析JSON"""
+    return orjson.loads(content)
+
+def _json_dumps(obj: Any) -> bytes:
+    """序列化請求主體為 JSON 位元組；UUID 與 dataclass 由 orjson 原生處理，其餘非原生型別轉為字串"""
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+def canonical_json(obj: Any) -> bytes:
+    """以排序鍵序列化為 JSON 位元組，供快取鍵雜湊使用；無法序列化的值轉為字串"""
+    return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+
 @dataclass
 class CacheEntry:
     """快取項目"""
@@ -36,12 +48,12 @@ class ResponseCache:
         
     def _generate_key(self, method: str, url: str, params: Dict = None, data: Dict = None) -> str:
         """生成快取鍵"""
-        content = f"{method}:{url}"
+        digest = hashlib.md5(f"{method}:{url}".encode())
         if params:
-            content += f":params:{json.dumps(params, sort_keys=True)}"
+            digest.update(b":params:" + canonical_json(params))
         if data:
-            content += f":data:{json.dumps(data, sort_keys=True)}"
-        return hashlib.md5(content.encode()).hexdigest()
+            digest.update(b":data:" + canonical_json(data))
+        return digest.hexdigest()
     
     def get(self, method: str, url: str, params: Dict = None, data: Dict = None) -> Optional[Any]:
         """從快取獲取數據"""
@@ -186,6 +198,9 @@ class HTTPClient:
         
         # 重試條件
         if exception:
+            # HTTP 錯誤回應已依狀態碼判定過，拋出的 ClientResponseError (如 4xx) 直接失敗
+            if isinstance(exception, aiohttp.ClientResponseError):
+                return False
             # 網路錯誤重試
             if isinstance(exception, (aiohttp.ClientError, asyncio.TimeoutError)):
                 return True
@@ -261,6 +276,12 @@ class HTTPClient:
             request_timeout = self.timeout
         request_headers = headers or {}
         
+        # 自行序列化JSON主體，取代 aiohttp 內建的 json.dumps (無法處理 UUID)
+        if json_data is not None:
+            data = _json_dumps(json_data)
+            json_data = None
+            request_headers = {'Content-Type': 'application/json', **request_headers}
+        
         # 重試邏輯
         last_exception = None
         last_status_code = None
@@ -282,10 +303,11 @@ class HTTPClient:
                     timeout=request_timeout
                 ) as response:
                     last_status_code = response.status
-                    response_text = await response.text()
+                    # 直接讀取位元組交給 JSON 解析器，省去先解碼為字串的完整複製
+                    response_body = await response.read()
                     
                     # 記錄回應
-                    logger.debug(f"回應: {response.status} {url} ({len(response_text)} 字符)")
+                    logger.debug(f"回應: {response.status} {url} ({len(response_body)} 位元組)")
                     
                     if response.status >= 400:
                         # HTTP錯誤
@@ -295,7 +317,7 @@ class HTTPClient:
                             continue
                         else:
                             # 不重試，拋出錯誤
-                            error_msg = f"HTTP {response.status}: {response_text[:200]}"
+                            error_msg = f"HTTP {response.status}: {response_body[:200].decode(errors='replace')}"
                             logger.error(f"HTTP錯誤: {error_msg}")
                             raise aiohttp.ClientResponseError(
                                 request_info=response.request_info,
@@ -306,9 +328,9 @@ class HTTPClient:
                     
                     # 解析回應
                     try:
-                        response_data = json.loads(response_text) if response_text else {}
-                    except json.JSONDecodeError:
-                        response_data = {"text": response_text}
+                        response_data = _json_loads(response_body) if response_body else {}
+                    except orjson.JSONDecodeError:
+                        response_data = {"text": response_body.decode(response.charset or 'utf-8', errors='replace')}
                     
                     # 快取成功回應
                     if (self.cache_enabled and not disable_cache and 
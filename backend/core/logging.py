@@ -21,6 +21,8 @@ def setup_logging():
     # 配置structlog
     structlog.configure(
         processors=[
+            # 未啟用的日誌等級直接丟棄，不再執行後續處理與格式化
+            structlog.stdlib.filter_by_level,
             # 添加時間戳
             structlog.processors.TimeStamper(fmt="ISO"),
             # 添加日誌等級
@@ -29,7 +31,7 @@ def setup_logging():
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             # JSON格式化（生產環境）或美化輸出（開發環境）
-            structlog.processors.JSONRenderer() if not settings.debug 
+            structlog.processors.JSONRenderer(default=str) if not settings.debug 
             else structlog.dev.ConsoleRenderer(colors=True)
         ],
         context_class=dict,
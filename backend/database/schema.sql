@@ -3,6 +3,8 @@
 
 -- 建立UUID擴展
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
+-- 三元組索引擴展 (關鍵詞 ILIKE 搜尋)
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
 
 -- 論文管理表 (加入TEI XML儲存，簡化使用者管理)
 CREATE TABLE IF NOT EXISTS papers (
@@ -155,6 +157,8 @@ CREATE INDEX IF NOT EXISTS idx_sections_type ON paper_sections(section_type);
 CREATE INDEX IF NOT EXISTS idx_sentences_detection_status ON sentences(detection_status);
 CREATE INDEX IF NOT EXISTS idx_sentences_paper_section ON sentences(paper_id, section_id);
 CREATE INDEX IF NOT EXISTS idx_sentences_text_search ON sentences USING gin(to_tsvector('english', content));
+CREATE INDEX IF NOT EXISTS idx_sentences_content_trgm ON sentences USING gin(content gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_sentences_section_defining_type ON sentences(section_id, defining_type);
 CREATE INDEX IF NOT EXISTS idx_sentences_retry_count ON sentences(retry_count);
 CREATE INDEX IF NOT EXISTS idx_sentences_has_objective ON sentences(has_objective);
 CREATE INDEX IF NOT EXISTS idx_sentences_has_dataset ON sentences(has_dataset);
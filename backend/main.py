@@ -10,7 +10,7 @@ import json
 
 from fastapi import FastAPI, Request, Response, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette import status
@@ -105,6 +105,10 @@ async def lifespan(app: FastAPI):
             await queue_service.stop_workers()
             logger.info("佇列處理服務已停止")
             
+            # 關閉N8N服務的共用連線池
+            from .services.n8n_service import n8n_service
+            await n8n_service.close()
+            
             await close_database()
             log_shutdown()
         except Exception as e:
@@ -118,7 +122,9 @@ app = FastAPI(
     description="基於AI的學術論文深度分析與比較系統",
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
-    lifespan=lifespan
+    lifespan=lifespan,
+    # 回應序列化使用 orjson，降低大型查詢結果的編碼成本
+    default_response_class=ORJSONResponse
 )
 
 
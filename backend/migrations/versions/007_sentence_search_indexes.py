@@ -0,0 +1,43 @@
+"""sentence_search_indexes
+
+Revision ID: 007_sentence_search_indexes
+Revises: 006_workspace_indexes
+Create Date: 2025-07-01 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '007_sentence_search_indexes'
+down_revision: Union[str, None] = '006_workspace_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create indexes backing the keyword and OD/CD sentence filters"""
+
+    # 1. Trigram index so `content ILIKE ANY(:patterns)` keyword search avoids a full scan
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sentences_content_trgm
+        ON sentences USING gin (content gin_trgm_ops)
+    """)
+
+    # 2. Sentences: section + defining type for per-section OD/CD lookups and counts
+    op.create_index(
+        'idx_sentences_section_defining_type',
+        'sentences',
+        ['section_id', 'defining_type'],
+        postgresql_using='btree'
+    )
+
+
+def downgrade() -> None:
+    """Remove sentence search indexes"""
+
+    op.drop_index('idx_sentences_section_defining_type')
+    op.execute("DROP INDEX IF EXISTS idx_sentences_content_trgm")
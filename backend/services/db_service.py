@@ -1,19 +1,20 @@
 import asyncio
 import time
+from functools import lru_cache
 from uuid import UUID
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, FrozenSet
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, desc, and_, or_, func, text
+from sqlalchemy import select, update, delete, desc, and_, or_, func, text, case
 from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.sql.elements import TextClause
 
 from ..models.paper import (
     Paper, PaperSection, Sentence, PaperSelection, ProcessingQueue,
     PaperCreate, PaperUpdate, PaperResponse,
     SectionCreate, SectionResponse,
     SentenceCreate, SentenceResponse,
-    ProcessingQueueCreate, ProcessingQueueResponse,
-    PaperSectionSummary, SectionSummary
+    ProcessingQueueCreate, ProcessingQueueResponse
 )
 from ..core.logging import get_logger
 from ..core.pagination import paginate_query, PaginatedResponse
@@ -22,9 +23,72 @@ from ..models.user import Workspace
 
 logger = get_logger(__name__)
 
+# 固定的 SQL 於模組載入時建立一次，避免每次呼叫重新解析 text()
+_WORKSPACE_SENTENCES_SQL = """
+    SELECT 
+        s.id as sentence_id,
+        s.content,
+        s.defining_type,
+        s.page_num,
+        s.sentence_order,
+        p.file_name,
+        ps.section_type,
+        p.workspace_id
+    FROM sentences s
+    JOIN paper_sections ps ON s.section_id = ps.id
+    JOIN papers p ON ps.paper_id = p.id
+    WHERE p.workspace_id = :workspace_id
+"""
+
+_SECTION_CONTENT_BY_WORKSPACE_SQL = text("""
+    SELECT 
+        ps.id as section_id,
+        ps.content,
+        ps.page_num,
+        p.file_name,
+        p.workspace_id
+    FROM paper_sections ps
+    JOIN papers p ON ps.paper_id = p.id
+    WHERE p.workspace_id = :workspace_id 
+      AND p.file_name = :paper_name 
+      AND ps.section_type = :section_type
+""")
+
+
+@lru_cache(maxsize=None)
+def _workspace_sentences_query(conditions: Tuple[str, ...], limited: bool = False) -> TextClause:
+    """
+    依過濾條件組合建立工作區句子搜尋查詢
+    
+    條件來自 search_sentences_in_workspace 中固定順序的五個可選過濾與 limited 旗標，
+    最多 2^6 = 64 種組合，故不設上限地全部快取
+    """
+    sql = _WORKSPACE_SENTENCES_SQL + "".join(f" AND {condition}" for condition in conditions)
+    sql += " ORDER BY p.file_name, ps.section_type, s.sentence_order"
+    if limited:
+        sql += " LIMIT :limit"
+    return text(sql)
+
+
 class DatabaseService:
     """資料庫服務類，處理所有資料庫操作"""
     
+    # 論文摘要快取：摘要只取決於論文集合，與查詢內容無關
+    SUMMARY_CACHE_TTL_SECONDS = 300
+    SUMMARY_CACHE_MAX_SIZE = 256
+    
+    def __init__(self):
+        self._summary_cache: Dict[FrozenSet[str], Tuple[float, List[Dict[str, Any]]]] = {}
+    
+    def invalidate_papers_summary(self, paper_id: Optional[str] = None):
+        """使包含指定論文的摘要快取失效，未指定時清空全部"""
+        if paper_id is None:
+            self._summary_cache.clear()
+            return
+        paper_id = str(paper_id)
+        for key in [key for key in self._summary_cache if paper_id in key]:
+            del self._summary_cache[key]
+    
     async def init_database(self):
         """初始化資料庫"""
         # 這個方法主要是為了相容性，實際初始化在 database.py 中
@@ -135,6 +199,7 @@ class DatabaseService:
         query = update(Paper).where(Paper.id == paper_id).values(**update_data)
         result = await db.execute(query)
         await db.commit()
+        self.invalidate_papers_summary(paper_id)
         return result.rowcount > 0
     
     async def update_paper_grobid_results(self, db: AsyncSession, paper_id: str, grobid_result: Dict[str, Any], status: str = "processing"):
@@ -247,6 +312,7 @@ class DatabaseService:
             
             # 4. 關鍵修復：確保提交事務
             await db.commit()
+            self.invalidate_papers_summary(paper_id)
             logger.info(f"章節和句子資料已成功提交到資料庫 - paper_id: {paper_id}, workspace_id: {workspace_id}")
             
             # 4.5 驗證狀態更新是否成功
@@ -303,7 +369,7 @@ class DatabaseService:
         ]
 
     async def save_od_cd_results(self, db: AsyncSession, paper_id: str, od_cd_results: List[Dict[str, Any]], status: str = "processing"):
-        """增量更新句子的檢測分析結果"""
+        """增量更新句子的檢測分析結果 (不提交；呼叫端 commit 後需呼叫 invalidate_papers_summary)"""
         update_statements = [
             update(Sentence).where(Sentence.id == result['id']).values(
                 has_objective=result.get("has_objective", None),
@@ -325,7 +391,7 @@ class DatabaseService:
                 processing_status=status
             )
         )
-        # No commit here
+        # No commit here; 摘要快取須由呼叫端於 commit 後失效，避免提交前的讀取重新快取舊的 OD/CD 數量
 
     async def delete_paper(self, db: AsyncSession, paper_id: str) -> bool:
         """刪除論文及其所有相關資料"""
@@ -340,6 +406,7 @@ class DatabaseService:
             result = await db.execute(delete(Paper).where(Paper.id == paper_id))
             
             await db.commit()
+            self.invalidate_papers_summary(paper_id)
             return result.rowcount > 0
         except Exception as e:
             await db.rollback()
@@ -863,72 +930,6 @@ class DatabaseService:
         await db.commit()
         return True
     
-    # ===== Papers with Sections Summary =====
-    
-    async def get_papers_with_sections_summary(self, db: AsyncSession, paper_ids: List[str]) -> List[PaperSectionSummary]:
-        """取得論文的section摘要資訊"""
-        query = (
-            select(Paper, PaperSection, func.count(Sentence.id).label('total_sentences'))
-            .outerjoin(PaperSection, Paper.id == PaperSection.paper_id)
-            .outerjoin(Sentence, PaperSection.id == Sentence.section_id)
-            .where(Paper.id.in_(paper_ids))
-            .group_by(Paper.id, PaperSection.id)
-            .order_by(Paper.file_name, PaperSection.section_order)
-        )
-        result = await db.execute(query)
-        
-        # 組織數據
-        papers_dict = {}
-        for paper, section, total_sentences in result:
-            paper_id = str(paper.id)
-            if paper_id not in papers_dict:
-                papers_dict[paper_id] = {
-                    "file_name": paper.file_name,
-                    "sections": []
-                }
-            
-            if section:
-                # 取得該section的OD/CD統計
-                od_count_query = (
-                    select(func.count(Sentence.id))
-                    .where(
-                        and_(
-                            Sentence.section_id == section.id,
-                            Sentence.defining_type == 'OD'
-                        )
-                    )
-                )
-                od_result = await db.execute(od_count_query)
-                od_count = od_result.scalar() or 0
-                
-                cd_count_query = (
-                    select(func.count(Sentence.id))
-                    .where(
-                        and_(
-                            Sentence.section_id == section.id,
-                            Sentence.defining_type == 'CD'
-                        )
-                    )
-                )
-                cd_result = await db.execute(cd_count_query)
-                cd_count = cd_result.scalar() or 0
-                
-                section_summary = SectionSummary(
-                    section_type=section.section_type,
-                    page_num=section.page_num,
-                    word_count=section.word_count or 0,
-                    brief_content=section.content[:100] + "..." if len(section.content) > 100 else section.content,
-                    od_count=od_count,
-                    cd_count=cd_count,
-                    total_sentences=total_sentences or 0
-                )
-                papers_dict[paper_id]["sections"].append(section_summary)
-        
-        return [
-            PaperSectionSummary(**paper_data) 
-            for paper_data in papers_dict.values()
-        ]
-
     async def get_sections_for_paper(self, db: AsyncSession, paper_id: str) -> List[PaperSection]:
         """獲取論文的所有章節"""
         query = (
@@ -947,6 +948,8 @@ class DatabaseService:
             .values(page_num=page_num)
         )
         result = await db.execute(query)
+        # 章節頁碼屬於摘要內容，無法得知所屬論文時清空全部摘要快取
+        self.invalidate_papers_summary()
         return result.rowcount > 0
 
     # ===== 工作區化方法 =====
@@ -1218,54 +1221,104 @@ class DatabaseService:
     ) -> List[Dict[str, Any]]:
         """
         獲取論文及其章節摘要資訊
+        
+        結果依論文集合快取並於論文資料變更時失效，返回的列表為共用物件，呼叫端不應修改
         """
         if not paper_ids:
             return []
+        
+        cache_key = frozenset(str(paper_id) for paper_id in paper_ids)
+        cached = self._summary_cache.get(cache_key)
+        if cached is not None and cached[0] > time.monotonic():
+            logger.debug(f"論文摘要快取命中: {len(cache_key)} 篇論文")
+            return cached[1]
             
         try:
             papers_summary = []
+            # 以集合查詢一次取得所有論文與章節，避免每篇論文各兩次資料庫往返
+            papers_result = await db.execute(select(Paper).where(Paper.id.in_(paper_ids)))
+            papers_by_id = {str(paper.id): paper for paper in papers_result.scalars()}
+            
+            sections_by_paper: Dict[str, List[Any]] = {}
+            if papers_by_id:
+                # 僅取摘要所需欄位：字數使用匯入時儲存的 word_count，內容只截取前 201 字元
+                # (多取一字元以判斷是否需加省略號)，不再傳輸完整章節內容
+                content = PaperSection.content
+                estimated_word_count = case(
+                    (content == '', 0),
+                    else_=func.length(content) - func.length(func.replace(content, ' ', '')) + 1
+                )
+                # 句子統計以分組聚合子查詢併入章節查詢，章節與統計一次往返取得
+                sentence_stats = (
+                    select(
+                        Sentence.section_id,
+                        func.count().label('total_sentences'),
+                        func.count().filter(Sentence.defining_type == 'OD').label('od_count'),
+                        func.count().filter(Sentence.defining_type == 'CD').label('cd_count')
+                    )
+                    .where(Sentence.paper_id.in_(list(papers_by_id)))
+                    .group_by(Sentence.section_id)
+                    .subquery()
+                )
+                sections_stmt = (
+                    select(
+                        PaperSection.id,
+                        PaperSection.paper_id,
+                        PaperSection.section_type,
+                        PaperSection.page_num,
+                        func.coalesce(PaperSection.word_count, estimated_word_count).label('word_count'),
+                        func.left(content, 201).label('content_head'),
+                        func.coalesce(sentence_stats.c.total_sentences, 0).label('total_sentences'),
+                        func.coalesce(sentence_stats.c.od_count, 0).label('od_count'),
+                        func.coalesce(sentence_stats.c.cd_count, 0).label('cd_count')
+                    )
+                    .outerjoin(sentence_stats, sentence_stats.c.section_id == PaperSection.id)
+                    .where(PaperSection.paper_id.in_(list(papers_by_id)))
+                    .order_by(PaperSection.section_order)
+                )
+                sections_result = await db.execute(sections_stmt)
+                for section in sections_result:
+                    sections_by_paper.setdefault(str(section.paper_id), []).append(section)
             
+            # 依傳入順序輸出
             for paper_id in paper_ids:
-                # 獲取論文基本資訊
-                stmt = select(Paper).where(Paper.id == paper_id)
-                result = await db.execute(stmt)
-                paper = result.scalar_one_or_none()
-                
+                paper = papers_by_id.get(str(paper_id))
                 if not paper:
                     continue
                 
-                # 獲取章節資訊
-                sections_stmt = select(PaperSection).where(PaperSection.paper_id == paper_id)
-                sections_result = await db.execute(sections_stmt)
-                sections = sections_result.scalars().all()
+                sections = sections_by_paper.get(str(paper.id), [])
                 
                 # 構建論文摘要
+                section_summaries = []
                 paper_summary = {
                     'file_name': paper.file_name,
                     'paper_id': str(paper.id),
                     'title': paper.original_filename or paper.file_name or '',
                     'workspace_id': str(paper.workspace_id),
-                    'sections': []
+                    'sections': section_summaries
                 }
                 
                 for section in sections:
-                    # 獲取章節統計資訊
-                    sentence_stats = await self._get_section_sentence_stats(db, section.id)
-                    
-                    section_summary = {
+                    content_head = section.content_head or ''
+                    section_summaries.append({
                         'section_type': section.section_type,
                         'page_num': section.page_num or 0,
-                        'word_count': len(section.content.split()) if section.content else 0,
-                        'brief_content': (section.content or '')[:200] + "...",
-                        'od_count': sentence_stats.get('od_count', 0),
-                        'cd_count': sentence_stats.get('cd_count', 0),
-                        'total_sentences': sentence_stats.get('total_sentences', 0)
-                    }
-                    paper_summary['sections'].append(section_summary)
+                        'word_count': section.word_count or 0,
+                        'brief_content': content_head[:200] + "..." if len(content_head) > 200 else content_head,
+                        'od_count': section.od_count,
+                        'cd_count': section.cd_count,
+                        'total_sentences': section.total_sentences
+                    })
                 
                 papers_summary.append(paper_summary)
             
             logger.info(f"生成了 {len(papers_summary)} 篇論文的摘要")
+            if len(self._summary_cache) >= self.SUMMARY_CACHE_MAX_SIZE:
+                # 移除最早加入的項目
+                del self._summary_cache[next(iter(self._summary_cache))]
+            self._summary_cache[cache_key] = (
+                time.monotonic() + self.SUMMARY_CACHE_TTL_SECONDS, papers_summary
+            )
             return papers_summary
             
         except Exception as e:
@@ -1279,58 +1332,49 @@ class DatabaseService:
         defining_types: Optional[List[str]] = None,
         keywords: Optional[List[str]] = None,
         section_type: Optional[str] = None,
-        paper_name: Optional[str] = None
+        paper_name: Optional[str] = None,
+        paper_ids: Optional[List[str]] = None,
+        limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         在工作區範圍內搜尋句子 - 嚴格工作區隔離
+        
+        paper_ids 以陣列條件下推至資料庫，一次查詢涵蓋多篇論文；
+        limit 由資料庫截斷結果，僅需前幾筆時不會取回整個工作區的句子
         """
         try:
-            # 基本查詢：僅限於指定工作區的論文
-            query = text("""
-                SELECT 
-                    s.id as sentence_id,
-                    s.content,
-                    s.defining_type,
-                    s.page_num,
-                    s.sentence_order,
-                    p.file_name,
-                    ps.section_type,
-                    p.workspace_id
-                FROM sentences s
-                JOIN paper_sections ps ON s.section_id = ps.id
-                JOIN papers p ON ps.paper_id = p.id
-                WHERE p.workspace_id = :workspace_id
-            """)
-            
-            params = {'workspace_id': str(workspace_id)}
+            params: Dict[str, Any] = {'workspace_id': str(workspace_id)}
+            conditions = []
             
             # 添加定義類型過濾
             if defining_types:
-                type_conditions = " OR ".join([f"s.defining_type = :type_{i}" for i in range(len(defining_types))])
-                query = text(str(query) + f" AND ({type_conditions})")
-                for i, dtype in enumerate(defining_types):
-                    params[f'type_{i}'] = dtype
+                conditions.append("s.defining_type = ANY(:defining_types)")
+                params['defining_types'] = list(defining_types)
             
             # 添加論文名稱過濾
             if paper_name:
-                query = text(str(query) + " AND p.file_name = :paper_name")
+                conditions.append("p.file_name = :paper_name")
                 params['paper_name'] = paper_name
             
             # 添加章節類型過濾
             if section_type:
-                query = text(str(query) + " AND ps.section_type = :section_type")
+                conditions.append("ps.section_type = :section_type")
                 params['section_type'] = section_type
             
-            # 添加關鍵詞過濾
-            if keywords:
-                keyword_conditions = " OR ".join([f"LOWER(s.content) LIKE :keyword_{i}" for i in range(len(keywords))])
-                query = text(str(query) + f" AND ({keyword_conditions})")
-                for i, keyword in enumerate(keywords):
-                    params[f'keyword_{i}'] = f'%{keyword.lower()}%'
+            # 添加多論文的陣列過濾
+            if paper_ids:
+                conditions.append("p.id = ANY(:paper_ids)")
+                params['paper_ids'] = [str(paper_id) for paper_id in paper_ids]
             
-            query = text(str(query) + " ORDER BY p.file_name, ps.section_type, s.sentence_order")
+            # 添加關鍵詞過濾：單一 ILIKE ANY 取代逐一 OR 的 LOWER(...) LIKE
+            if keywords:
+                conditions.append("s.content ILIKE ANY(:keyword_patterns)")
+                params['keyword_patterns'] = [f'%{keyword}%' for keyword in keywords]
             
-            result = await db.execute(query, params)
+            # 基本查詢僅限於指定工作區的論文，再附加過濾條件
+            if limit:
+                params['limit'] = limit
+            result = await db.execute(_workspace_sentences_query(tuple(conditions), bool(limit)), params)
             rows = result.fetchall()
             
             sentences = []
@@ -1364,21 +1408,7 @@ class DatabaseService:
         獲取工作區範圍內的章節完整內容
         """
         try:
-            query = text("""
-                SELECT 
-                    ps.id as section_id,
-                    ps.content,
-                    ps.page_num,
-                    p.file_name,
-                    p.workspace_id
-                FROM paper_sections ps
-                JOIN papers p ON ps.paper_id = p.id
-                WHERE p.workspace_id = :workspace_id 
-                  AND p.file_name = :paper_name 
-                  AND ps.section_type = :section_type
-            """)
-            
-            result = await db.execute(query, {
+            result = await db.execute(_SECTION_CONTENT_BY_WORKSPACE_SQL, {
                 'workspace_id': str(workspace_id),
                 'paper_name': paper_name,
                 'section_type': section_type
@@ -1401,36 +1431,159 @@ class DatabaseService:
             logger.error(f"獲取工作區章節內容失敗: workspace={workspace_id}, paper={paper_name}, section={section_type}, error={str(e)}")
             return None
 
-    async def _get_section_sentence_stats(
+    async def get_definitions_by_sections(
         self,
         db: AsyncSession,
-        section_id: str
-    ) -> Dict[str, int]:
+        sections: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], List[Any]]:
         """
-        獲取章節的句子統計資訊
-        """
-        try:
-            query = text("""
-                SELECT 
-                    COUNT(*) as total_sentences,
-                    SUM(CASE WHEN defining_type = 'OD' THEN 1 ELSE 0 END) as od_count,
-                    SUM(CASE WHEN defining_type = 'CD' THEN 1 ELSE 0 END) as cd_count
-                FROM sentences 
-                WHERE section_id = :section_id
-            """)
+        批次獲取多個章節的定義句子 (OD/CD)，單次查詢取代逐章節查詢
+        
+        Args:
+            sections: (paper_id, section_name) 列表
             
-            result = await db.execute(query, {'section_id': section_id})
-            row = result.fetchone()
+        Returns:
+            以 (paper_id, 小寫 section_name) 為鍵的定義列表，每列包含 page_num、text、definition_type
+        """
+        requested = {(str(paper_id), section_name.lower()) for paper_id, section_name in sections}
+        if not requested:
+            return {}
+
+        section_type = func.lower(PaperSection.section_type)
+        stmt = (
+            select(
+                Sentence.paper_id,
+                section_type.label('section_type'),
+                func.coalesce(Sentence.page_num, PaperSection.page_num).label('page_num'),
+                Sentence.content.label('text'),
+                Sentence.defining_type.label('definition_type')
+            )
+            .join(PaperSection, Sentence.section_id == PaperSection.id)
+            .where(
+                and_(
+                    Sentence.paper_id.in_({paper_id for paper_id, _ in requested}),
+                    section_type.in_({name for _, name in requested}),
+                    Sentence.defining_type.in_(['OD', 'CD'])
+                )
+            )
+            .order_by(PaperSection.section_order, Sentence.sentence_order)
+        )
+        result = await db.execute(stmt)
+
+        definitions: Dict[Tuple[str, str], List[Any]] = {}
+        for row in result:
+            key = (str(row.paper_id), row.section_type)
+            # paper_id 與 section_type 分別過濾，需排除未被選取的組合
+            if key in requested:
+                definitions.setdefault(key, []).append(row)
+        return definitions
+
+    async def get_full_sections_content(
+        self,
+        db: AsyncSession,
+        sections: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """
+        批次獲取多個章節的完整內容，單次查詢取代逐章節查詢
+        
+        Args:
+            sections: (paper_id, section_name) 列表
             
-            return {
-                'total_sentences': row.total_sentences or 0,
-                'od_count': row.od_count or 0,
-                'cd_count': row.cd_count or 0
+        Returns:
+            以 (paper_id, 小寫 section_name) 為鍵，值包含 text (同類型的多個章節依順序合併) 與 page_num
+        """
+        requested = {(str(paper_id), section_name.lower()) for paper_id, section_name in sections}
+        if not requested:
+            return {}
+
+        section_type = func.lower(PaperSection.section_type)
+        stmt = (
+            select(
+                PaperSection.paper_id,
+                section_type.label('section_type'),
+                PaperSection.content,
+                PaperSection.page_num
+            )
+            .where(
+                and_(
+                    PaperSection.paper_id.in_({paper_id for paper_id, _ in requested}),
+                    section_type.in_({name for _, name in requested})
+                )
+            )
+            .order_by(PaperSection.section_order)
+        )
+        result = await db.execute(stmt)
+
+        grouped: Dict[Tuple[str, str], List[Any]] = {}
+        for row in result:
+            key = (str(row.paper_id), row.section_type)
+            # paper_id 與 section_type 分別過濾，需排除未被選取的組合
+            if key in requested:
+                grouped.setdefault(key, []).append(row)
+        
+        return {
+            key: {
+                'text': "\n\n".join(row.content for row in rows if row.content),
+                'page_num': rows[0].page_num
             }
-            
-        except Exception as e:
-            logger.error(f"獲取章節統計失敗: section_id={section_id}, error={str(e)}")
-            return {'total_sentences': 0, 'od_count': 0, 'cd_count': 0}
+            for key, rows in grouped.items()
+        }
+
+    async def get_top_k_sentences_by_sections(
+        self,
+        db: AsyncSession,
+        sections: List[Tuple[str, str]],
+        k: int = 5
+    ) -> Dict[Tuple[str, str], List[Any]]:
+        """
+        批次獲取多個章節的關鍵句子，單次查詢取代逐章節查詢；每章節取前 k 句，定義句子 (OD/CD) 優先，其餘依原文順序
+        
+        Returns:
+            以 (paper_id, 小寫 section_name) 為鍵的句子列表，每列包含 page_num、sentence
+        """
+        requested = {(str(paper_id), section_name.lower()) for paper_id, section_name in sections}
+        if not requested:
+            return {}
+
+        section_type = func.lower(PaperSection.section_type)
+        ranked = (
+            select(
+                Sentence.paper_id,
+                section_type.label('section_type'),
+                func.coalesce(Sentence.page_num, PaperSection.page_num).label('page_num'),
+                Sentence.content.label('sentence'),
+                func.row_number().over(
+                    partition_by=(Sentence.paper_id, section_type),
+                    order_by=(
+                        case((Sentence.defining_type.in_(['OD', 'CD']), 0), else_=1),
+                        PaperSection.section_order,
+                        Sentence.sentence_order
+                    )
+                ).label('rank')
+            )
+            .join(PaperSection, Sentence.section_id == PaperSection.id)
+            .where(
+                and_(
+                    Sentence.paper_id.in_({paper_id for paper_id, _ in requested}),
+                    section_type.in_({name for _, name in requested})
+                )
+            )
+            .subquery()
+        )
+        stmt = (
+            select(ranked.c.paper_id, ranked.c.section_type, ranked.c.page_num, ranked.c.sentence)
+            .where(ranked.c.rank <= k)
+            .order_by(ranked.c.paper_id, ranked.c.section_type, ranked.c.rank)
+        )
+        result = await db.execute(stmt)
+
+        sentences: Dict[Tuple[str, str], List[Any]] = {}
+        for row in result:
+            key = (str(row.paper_id), row.section_type)
+            # paper_id 與 section_type 分別過濾，需排除未被選取的組合
+            if key in requested:
+                sentences.setdefault(key, []).append(row)
+        return sentences
 
     async def verify_workspace_access(
         self,
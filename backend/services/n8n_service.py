@@ -16,6 +16,18 @@ from ..core.http_client import create_client, HTTPClient
 
 logger = get_logger("n8n_service")
 
+# API 文檔規定的回應欄位，於模組載入時建立一次
+_SECTION_SELECTION_FIELDS = frozenset({'selected_sections', 'analysis_focus', 'suggested_approach'})
+_ANALYSIS_RESPONSE_FIELDS = frozenset({'response', 'references', 'source_summary'})
+
+@dataclass(slots=True)
+class ContentBlock:
+    """送往統一內容分析的單一章節內容，於 N8N 請求序列化時直接轉為 JSON 物件"""
+    paper_name: str
+    section_type: str
+    content_type: str
+    content: Any
+
 @dataclass
 class BatchRequest:
     """批次請求項目"""
@@ -101,7 +113,7 @@ class N8NService:
         self.request_stats['total_requests'] += 1
         
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             response = await self.client.post(
                 endpoint=endpoint,
@@ -110,7 +122,7 @@ class N8NService:
                 disable_cache=disable_cache
             )
             
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             if response:
                 self.request_stats['successful_requests'] += 1
@@ -148,7 +160,7 @@ class N8NService:
             "sentence": sentence
         }
         
-        logger.info(f"執行OD/CD檢測: {sentence[:50]}...")
+        logger.debug(f"執行OD/CD檢測: {sentence[:50]}...")
         
         try:
             result = await self.client.post(
@@ -161,10 +173,10 @@ class N8NService:
             
             # 驗證回應格式 {"defining_type": "string", "reason": "string"}
             if 'defining_type' in result and 'reason' in result:
-                logger.info(f"OD/CD檢測完成: {result['defining_type']}")
+                logger.debug(f"OD/CD檢測完成: {result['defining_type']}")
                 return result
             else:
-                logger.warning(f"OD/CD檢測回應格式異常: {result}")
+                logger.warning(f"OD/CD檢測回應格式異常，實際欄位: {list(result.keys()) if isinstance(result, dict) else type(result).__name__}")
                 return {"error": "回應格式異常", "raw_response": result}
                 
         except Exception as e:
@@ -190,14 +202,23 @@ class N8NService:
         """
         # 根據API文件，使用 application/x-www-form-urlencoded 格式
         request_data = {
-            "query": query
+            "query": query.strip()
         }
+        endpoint = self.endpoints['keyword_extraction']
+        
+        # 相同內容的關鍵詞提取結果固定，重複請求 (如重新處理同一論文) 直接使用快取
+        if self.client.cache_enabled:
+            cached = self.client.cache.get('POST', endpoint, data=request_data)
+            if cached is not None:
+                self.request_stats['cached_requests'] += 1
+                logger.debug(f"關鍵詞提取快取命中: {query[:50]}...")
+                return cached
         
         logger.info(f"執行關鍵詞提取: {query[:50]}...")
         
         try:
             result = await self.client.post(
-                endpoint=self.endpoints['keyword_extraction'],
+                endpoint=endpoint,
                 data=request_data,  # 使用 data 而非 json_data
                 headers={'Content-Type': 'application/x-www-form-urlencoded'},
                 timeout=30
@@ -240,12 +261,15 @@ class N8NService:
 
             if keywords:
                 logger.info(f"關鍵詞提取完成，提取到 {len(keywords)} 個關鍵詞")
-                return {
+                keyword_result = {
                     'keywords': keywords,
                     'total_keywords': len(keywords)
                 }
+                if self.client.cache_enabled:
+                    self.client.cache.set('POST', endpoint, keyword_result, request_data=request_data)
+                return keyword_result
             else:
-                logger.warning(f"無法解析關鍵詞提取回應格式: {result}")
+                logger.warning(f"無法解析關鍵詞提取回應格式，實際欄位: {list(result.keys()) if isinstance(result, dict) else type(result).__name__}")
                 return {"error": "回應格式異常", "raw_response": result}
                 
         except Exception as e:
@@ -256,6 +280,32 @@ class N8NService:
                 "failed_at": datetime.now().isoformat()
             }
     
+    async def batch_extract_keywords(self, queries: List[str]) -> List[Dict[str, Any]]:
+        """
+        批次關鍵詞提取，並發呼叫並限制併發數；重複的查詢只呼叫一次
+        
+        Args:
+            queries: 需要萃取關鍵字的文字列表
+            
+        Returns:
+            與 queries 順序對應的關鍵詞提取結果
+        """
+        unique_queries = list(dict.fromkeys(queries))
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        
+        async def bounded_extract(query: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.extract_keywords(query)
+        
+        responses = await asyncio.gather(
+            *[bounded_extract(q) for q in unique_queries], return_exceptions=True
+        )
+        results = {
+            query: {"error": str(response)} if isinstance(response, Exception) else response
+            for query, response in zip(unique_queries, responses)
+        }
+        return [results[q] for q in queries]
+    
     # ===== 新API方法 (Backlog #8功能) =====
     
     async def intelligent_section_selection(
@@ -298,14 +348,13 @@ class N8NService:
                 actual_result = result
 
             # 驗證回應格式符合API文檔
-            expected_fields = ['selected_sections', 'analysis_focus', 'suggested_approach']
-            if all(field in actual_result for field in expected_fields):
+            if _SECTION_SELECTION_FIELDS <= actual_result.keys():
                 selected_count = len(actual_result['selected_sections'])
                 analysis_focus = actual_result['analysis_focus']
                 logger.info(f"智能章節選擇完成，選擇了 {selected_count} 個章節，分析重點: {analysis_focus}")
                 return actual_result
             else:
-                logger.warning(f"智能章節選擇回應格式異常，期望欄位: {expected_fields}, 實際欄位: {list(actual_result.keys())}")
+                logger.warning(f"智能章節選擇回應格式異常，期望欄位: {sorted(_SECTION_SELECTION_FIELDS)}, 實際欄位: {list(actual_result.keys())}")
                 return {"error": "回應格式異常", "raw_response": result}
                 
         except Exception as e:
@@ -320,7 +369,7 @@ class N8NService:
     async def unified_content_analysis(
         self,
         query: str,
-        selected_content: List[Dict[str, Any]],
+        selected_content: List[Union[ContentBlock, Dict[str, Any]]],
         analysis_focus: str = "definitions"
     ) -> Dict[str, Any]:
         """
@@ -328,7 +377,7 @@ class N8NService:
         
         Args:
             query: 原始查詢語句
-            selected_content: LLM選中的section內容
+            selected_content: LLM選中的section內容 (ContentBlock 或相同欄位的字典)
             analysis_focus: 分析重點類型 (definitions, methods, comparison)
             
         Returns:
@@ -356,8 +405,7 @@ class N8NService:
                 actual_result = result
             
             # 驗證回應格式符合API文檔
-            expected_fields = ['response', 'references', 'source_summary']
-            if all(field in actual_result for field in expected_fields):
+            if _ANALYSIS_RESPONSE_FIELDS <= actual_result.keys():
                 reference_count = len(actual_result['references'])
                 papers_analyzed = actual_result['source_summary'].get('total_papers', 0)
                 logger.info(f"統一內容分析完成，生成 {reference_count} 個引用，分析 {papers_analyzed} 篇論文")
@@ -421,8 +469,7 @@ class N8NService:
             )
             
             # 驗證回應格式符合API文檔
-            expected_fields = ['response', 'references', 'source_summary']
-            if all(field in result for field in expected_fields):
+            if _ANALYSIS_RESPONSE_FIELDS <= result.keys():
                 reference_count = len(result['references'])
                 papers_used = len(result['source_summary'].get('papers_used', []))
                 logger.info(f"增強型組織回應完成，生成 {reference_count} 個引用，使用 {papers_used} 篇論文")
@@ -518,7 +565,7 @@ class N8NService:
     
     async def _process_single_batch_request(self, request: BatchRequest) -> BatchResponse:
         """處理單個批次請求"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             result = await self._call_n8n_webhook(
@@ -527,7 +574,7 @@ class N8NService:
                 disable_cache=False  # 批次請求使用快取
             )
             
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             return BatchResponse(
                 request_id=request.id,
@@ -537,7 +584,7 @@ class N8NService:
             )
             
         except Exception as e:
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             return BatchResponse(
                 request_id=request.id,
@@ -660,6 +707,10 @@ class N8NService:
             "base_url": self.base_url
         }
     
+    async def close(self):
+        """關閉共用的HTTP客戶端連線池"""
+        await self.client.close()
+    
     def clear_cache(self):
         """清空快取"""
         self.client.clear_cache()
@@ -21,6 +21,7 @@ from ..services.n8n_service import n8n_service
 from ..services.split_sentences_service import split_sentences_service
 from ..services.queue_service import queue_service, QueueTask, TaskPriority
 from ..services.db_service import db_service
+from ..services.unified_query_service import unified_query_processor
 from ..core.database import get_db
 from ..models.paper import Paper, PaperSection, Sentence
 from sqlalchemy.dialects.postgresql import insert as pg_insert
@@ -254,6 +255,7 @@ class ProcessingService:
                     od_cd_results=od_cd_results
                 )
                 await session.commit()
+                db_service.invalidate_papers_summary(file_id)
                 logger.info(f"[進度] OD/CD 檢測完成並已儲存: {file_id}")
             
             # 步驟 4: 最終驗證與處理
@@ -273,6 +275,9 @@ class ProcessingService:
             
             # 更新最終狀態
             await db_service.update_paper_status(session, file_id, "completed")
+            # 論文內容已完整寫入，使該工作區的論文摘要與查詢回答快取失效
+            if paper.workspace_id:
+                unified_query_processor.invalidate_workspace(paper.workspace_id)
             
             # 清理暫存檔案
             await self._cleanup_temp_files(file_info)
@@ -811,33 +816,25 @@ class ProcessingService:
         """關鍵詞提取"""
         all_keywords = []
         
-        for section in sections_analysis:
-            content = section["content"]
-            
-            if len(content.strip()) > 50:  # 只處理有足夠內容的章節
-                try:
-                    result = await n8n_service.extract_keywords(
-                        query=content,
-                    )
-                    
-                    if "error" not in result and "keywords" in result:
-                        section_keywords = {
-                            "section_id": section["section_id"],
-                            "section_title": section["title"],
-                            "section_type": section["section_type"],
-                            "keywords": result["keywords"],
-                            "keyword_count": len(result["keywords"]),
-                            "extraction_confidence": result.get("confidence", 0.0)
-                        }
-                        all_keywords.append(section_keywords)
-                    else:
-                        logger.warning(f"關鍵詞提取失敗: {section['section_id']} - {result.get('error', '未知錯誤')}")
-                
-                except Exception as e:
-                    logger.error(f"關鍵詞提取異常: {section['section_id']} - {e}")
-                
-                # 避免 API 限流
-                # await asyncio.sleep(0.3)  # ✅ 暫時註解掉延遲
+        # 只處理有足夠內容的章節，各章節並發提取
+        eligible_sections = [s for s in sections_analysis if len(s["content"].strip()) > 50]
+        results = await n8n_service.batch_extract_keywords(
+            [section["content"] for section in eligible_sections]
+        )
+        
+        for section, result in zip(eligible_sections, results):
+            if "error" not in result and "keywords" in result:
+                section_keywords = {
+                    "section_id": section["section_id"],
+                    "section_title": section["title"],
+                    "section_type": section["section_type"],
+                    "keywords": result["keywords"],
+                    "keyword_count": len(result["keywords"]),
+                    "extraction_confidence": result.get("confidence", 0.0)
+                }
+                all_keywords.append(section_keywords)
+            else:
+                logger.warning(f"關鍵詞提取失敗: {section['section_id']} - {result.get('error', '未知錯誤')}")
         
         total_keywords = sum(len(k["keywords"]) for k in all_keywords)
         logger.info(f"關鍵詞提取完成，從 {len(all_keywords)} 個章節提取 {total_keywords} 個關鍵詞")
@@ -4,40 +4,85 @@
 """
 
 import asyncio
-from typing import Dict, List, Any, Optional
+import hashlib
+import time
+from collections import deque
+from typing import Dict, List, Any, Optional, Set, Tuple, Callable, Awaitable, Deque
 from datetime import datetime
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
 from backend.core.logging import get_logger
-from backend.services.n8n_service import n8n_service
+from backend.core.observability import observability
+from backend.core.http_client import ResponseCache, canonical_json
+from backend.services.n8n_service import n8n_service, N8NService, ContentBlock
 from backend.services.db_service import db_service
 from backend.core.exceptions import QueryProcessingError, DataValidationError
-from backend.core.database import get_db
+from backend.core.database import AsyncSessionLocal
 
 logger = get_logger(__name__)
 
-def convert_uuids_to_strings(data: Any) -> Any:
-    """遞迴轉換字典或列表中的 UUID 物件為字串"""
-    if isinstance(data, dict):
-        return {k: convert_uuids_to_strings(v) for k, v in data.items()}
-    elif isinstance(data, list):
-        return [convert_uuids_to_strings(i) for i in data]
-    elif isinstance(data, UUID):
-        return str(data)
-    else:
-        return data
+def _payload_key(*parts: Any) -> str:
+    """以正規化的 JSON 內容生成請求鍵，用於合併相同的 N8N 請求"""
+    return hashlib.md5(canonical_json(parts)).hexdigest()
 
 class UnifiedQueryProcessor:
     """統一查詢處理器 - 處理所有類型的查詢，嚴格執行工作區隔離"""
     
-    def __init__(self):
-        self.processing_stats = {
-            'total_queries': 0,
-            'successful_queries': 0,
-            'failed_queries': 0,
-            'average_processing_time': 0.0
-        }
+    # 工作區論文摘要快取：互動查詢常連續發生在未變動的工作區上
+    WORKSPACE_SUMMARY_TTL_SECONDS = 30
+    WORKSPACE_SUMMARY_CACHE_MAX_SIZE = 256
+    HEALTH_CHECK_TTL_SECONDS = 5
+    # 查詢回答快取：相同工作區內重複的查詢 (重新整理、多人協作) 直接返回先前的分析結果
+    ANSWER_CACHE_TTL_SECONDS = 600
+    ANSWER_CACHE_MAX_SIZE = 512
+    
+    def __init__(self, n8n_client: Optional[N8NService] = None):
+        # 所有 N8N 呼叫必須共用同一個具連線池的 HTTP 客戶端 (keep-alive)，
+        # 否則並發請求會各自建立 TCP 連線，合併與並行處理的效益將被抵銷
+        self.n8n = n8n_client or n8n_service
+        # 處理統計：僅累加計數與總耗時，平均值於讀取時計算
+        self._total_queries = 0
+        self._successful_queries = 0
+        self._failed_queries = 0
+        self._processing_time_sum = 0.0
+        # 最近的處理時間 (固定長度)，用於計算延遲百分位數
+        self._recent_processing_times: Deque[float] = deque(maxlen=1000)
+        # 進行中的 N8N 請求，相同輸入的並發請求共用同一次呼叫
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # N8N 結果快取，鍵為查詢與輸入內容的雜湊，重複查詢可直接返回
+        self._n8n_cache = ResponseCache(default_ttl_seconds=300)
+        # workspace_id -> (到期時間, 論文摘要)；每個工作區一把鎖，避免同時重複查詢
+        self._workspace_summary_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._workspace_summary_locks: Dict[str, asyncio.Lock] = {}
+        # (workspace_id, 查詢與論文集合雜湊) -> (到期時間, 分析結果)
+        self._answer_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+        # (到期時間, 健康檢查結果)
+        self._health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+    
+    def invalidate_workspace(self, workspace_id: Optional[UUID] = None):
+        """使工作區論文摘要與查詢回答快取失效 (論文選取、上傳或刪除後呼叫)，未指定時清空全部"""
+        if workspace_id is None:
+            self._workspace_summary_cache.clear()
+            self._answer_cache.clear()
+            # 使用中的鎖保留給等待者，其餘一併移除
+            self._workspace_summary_locks = {
+                key: lock for key, lock in self._workspace_summary_locks.items() if lock.locked()
+            }
+            return
+        workspace_key = str(workspace_id)
+        self._workspace_summary_cache.pop(workspace_key, None)
+        self._discard_summary_lock(workspace_key)
+        for key in [key for key in self._answer_cache if key[0] == workspace_key]:
+            del self._answer_cache[key]
+    
+    def _discard_summary_lock(self, workspace_key: str):
+        """移除未使用的工作區摘要鎖，使鎖的數量不超過快取項目 (使用中的鎖由持有者完成後再處理)"""
+        lock = self._workspace_summary_locks.get(workspace_key)
+        if lock is not None and not lock.locked():
+            del self._workspace_summary_locks[workspace_key]
     
     async def process_query(
         self, 
@@ -54,36 +99,40 @@ class UnifiedQueryProcessor:
         Returns:
             統一格式的查詢回應
         """
-        start_time = datetime.now()
-        self.processing_stats['total_queries'] += 1
+        start_time = time.perf_counter()
+        self._total_queries += 1
+        workspace_id = query_params.get('workspace_id')
+        workspace_str = str(workspace_id) if workspace_id else None
 
         try:
             # 1. 強制驗證工作區ID
-            workspace_id = query_params.get('workspace_id')
             if not workspace_id:
                 raise QueryProcessingError("workspace_id is required for all queries")
             
             query = query_params.get('query', '')
-            logger.info(f"開始處理工作區查詢: workspace={workspace_id}, query={query[:50]}...")
+            logger.info("開始處理工作區查詢", workspace=workspace_str, query=query[:50])
             
             # 2. 驗證並獲取工作區範圍內的論文摘要
             papers_summary = await self._get_workspace_papers_summary(db, workspace_id)
             
             if not papers_summary:
+                return self._empty_response(
+                    query, workspace_str, start_time,
+                    response=f"工作區 {workspace_id} 中沒有可用的論文資料",
+                    error_message="工作區中沒有可用的論文資料"
+                )
+            
+            # 相同查詢且論文摘要 (含各章節句子與 OD/CD 數量) 未變動時直接返回先前的分析結果
+            answer_key = (workspace_str, _payload_key(query.strip(), papers_summary))
+            cached_answer = self._answer_cache.get(answer_key)
+            if cached_answer is not None and cached_answer[0] > time.monotonic():
+                processing_time = time.perf_counter() - start_time
+                self._record_success(processing_time)
+                logger.info("查詢回答快取命中", workspace=workspace_str)
                 return {
+                    **cached_answer[1],
                     'query': query,
-                    'response': f"工作區 {workspace_id} 中沒有可用的論文資料",
-                    'references': [],
-                    'source_summary': {
-                        'total_papers': 0,
-                        'papers_used': [],
-                        'workspace_id': str(workspace_id),
-                        'error_occurred': True,
-                        'error_message': "工作區中沒有可用的論文資料"
-                    },
-                    'processing_time': 0,
-                    'papers_analyzed': 0,
-                    'workspace_id': str(workspace_id),
+                    'processing_time': processing_time,
                     'timestamp': datetime.now().isoformat()
                 }
             
@@ -96,60 +145,138 @@ class UnifiedQueryProcessor:
             selected_sections = section_selection.get('selected_sections', [])
             analysis_focus = section_selection.get('analysis_focus', 'definitions')
             selected_content = await self._extract_workspace_content(
-                db, query, selected_sections, analysis_focus, workspace_id
+                db, query, selected_sections, analysis_focus, workspace_id,
+                paper_names={paper['paper_id']: paper['file_name'] for paper in papers_summary}
             )
             
             # 5. 步驟3: 統一內容分析
-            logger.info(f"即將進行統一內容分析，workspace={workspace_id}, selected_content: {len(selected_content)} 項")
+            logger.info("即將進行統一內容分析", workspace=workspace_str, selected_content=len(selected_content))
             analysis_result = await self._unified_content_analysis(
                 query, selected_content, section_selection
             )
             
-            # 6. 記錄成功處理
-            processing_time = (datetime.now() - start_time).total_seconds()
-            self.processing_stats['successful_queries'] += 1
-            self.processing_stats['average_processing_time'] = (
-                (self.processing_stats['average_processing_time'] * (self.processing_stats['successful_queries'] - 1) + processing_time)
-                / self.processing_stats['successful_queries']
-            )
+            # 6. 記錄處理結果；沒有可分析內容時未經 N8N 分析 (可能來自資料庫暫時失敗)，不計入成功指標
+            processing_time = time.perf_counter() - start_time
+            no_content = analysis_result.get('source_summary', {}).get('no_content', False)
+            if no_content:
+                observability.metrics_collector.increment_counter('unified_query_total', tags={'status': 'no_content'})
+            else:
+                self._record_success(processing_time)
             
             # 7. 確保回應包含工作區資訊
-            analysis_result['workspace_id'] = str(workspace_id)
+            analysis_result['workspace_id'] = workspace_str
             analysis_result['processing_time'] = processing_time
             analysis_result['papers_analyzed'] = len(papers_summary)
             analysis_result['timestamp'] = datetime.now().isoformat()
             
-            logger.info(f"工作區查詢處理完成: workspace={workspace_id}, 處理時間={processing_time:.2f}s")
+            # 僅快取經 N8N 分析的結果
+            if not no_content:
+                if len(self._answer_cache) >= self.ANSWER_CACHE_MAX_SIZE:
+                    # 移除最早加入的項目
+                    del self._answer_cache[next(iter(self._answer_cache))]
+                self._answer_cache[answer_key] = (
+                    time.monotonic() + self.ANSWER_CACHE_TTL_SECONDS, dict(analysis_result)
+                )
+            
+            logger.info("工作區查詢處理完成", workspace=workspace_str, processing_time=round(processing_time, 2))
             return analysis_result
             
         except Exception as e:
-            self.processing_stats['failed_queries'] += 1
-            processing_time = (datetime.now() - start_time).total_seconds()
+            self._failed_queries += 1
+            observability.metrics_collector.increment_counter('unified_query_total', tags={'status': 'error'})
             
-            logger.error(f"工作區查詢處理失敗: workspace={workspace_id}, error={str(e)}")
+            # 預期的處理錯誤已在發生處記錄，未預期的錯誤才需要完整堆疊
+            logger.error(
+                "工作區查詢處理失敗", workspace=workspace_str, error=str(e),
+                exc_info=not isinstance(e, (QueryProcessingError, DataValidationError))
+            )
             
-            return {
-                'query': query_params.get('query', ''),
-                'response': f"查詢處理失敗: {str(e)}",
-                'references': [],
-                'source_summary': {
-                    'total_papers': 0,
-                    'papers_used': [],
-                    'workspace_id': str(workspace_id) if workspace_id else None,
-                    'error_occurred': True,
-                    'error_message': str(e)
-                },
-                'processing_time': processing_time,
-                'papers_analyzed': 0,
-                'workspace_id': str(workspace_id) if workspace_id else None,
-                'timestamp': datetime.now().isoformat(),
-                'error': True
-            }
+            error_response = self._empty_response(
+                query_params.get('query', ''), workspace_str, start_time,
+                response=f"查詢處理失敗: {str(e)}",
+                error_message=str(e)
+            )
+            error_response['error'] = True
+            return error_response
+    
+    def _record_success(self, processing_time: float):
+        """記錄成功處理的查詢與耗時，並匯出至全域指標收集器"""
+        self._successful_queries += 1
+        self._processing_time_sum += processing_time
+        self._recent_processing_times.append(processing_time)
+        observability.metrics_collector.increment_counter('unified_query_total', tags={'status': 'success'})
+        observability.metrics_collector.record_histogram('unified_query_duration_seconds', processing_time)
+    
+    def _empty_response(
+        self,
+        query: str,
+        workspace_str: Optional[str],
+        start_time: float,
+        *,
+        response: str,
+        error_message: str
+    ) -> Dict[str, Any]:
+        """建立未經 N8N 分析的回應 (無可用論文或處理失敗)，與正常回應欄位一致"""
+        return {
+            'query': query,
+            'response': response,
+            'references': [],
+            'source_summary': {
+                'total_papers': 0,
+                'papers_used': [],
+                'workspace_id': workspace_str,
+                'error_occurred': True,
+                'error_message': error_message
+            },
+            'processing_time': time.perf_counter() - start_time,
+            'papers_analyzed': 0,
+            'workspace_id': workspace_str,
+            'timestamp': datetime.now().isoformat()
+        }
     
     async def _get_workspace_papers_summary(
         self, 
         db: AsyncSession, 
         workspace_id: UUID
+    ) -> List[Dict[str, Any]]:
+        """
+        獲取工作區範圍內的論文摘要，結果依工作區短暫快取
+        
+        返回的列表為共用物件，呼叫端不應修改
+        """
+        workspace_key = str(workspace_id)
+        cached = self._workspace_summary_cache.get(workspace_key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        
+        lock = self._workspace_summary_locks.setdefault(workspace_key, asyncio.Lock())
+        async with lock:
+            # 等待鎖期間其他請求可能已完成查詢
+            cached = self._workspace_summary_cache.get(workspace_key)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+            
+            papers_summary = await self._load_workspace_papers_summary(db, workspace_id)
+            # 空結果可能來自查詢失敗，不快取
+            if papers_summary:
+                if len(self._workspace_summary_cache) >= self.WORKSPACE_SUMMARY_CACHE_MAX_SIZE:
+                    # 移除最早加入的項目及其鎖
+                    evicted_key = next(iter(self._workspace_summary_cache))
+                    del self._workspace_summary_cache[evicted_key]
+                    self._discard_summary_lock(evicted_key)
+                self._workspace_summary_cache[workspace_key] = (
+                    time.monotonic() + self.WORKSPACE_SUMMARY_TTL_SECONDS, papers_summary
+                )
+        
+        # 未快取的工作區 (空結果或持有期間被失效) 不保留鎖
+        if workspace_key not in self._workspace_summary_cache:
+            self._discard_summary_lock(workspace_key)
+        return papers_summary
+    
+    async def _load_workspace_papers_summary(
+        self, 
+        db: AsyncSession, 
+        workspace_id: UUID
     ) -> List[Dict[str, Any]]:
         """
         獲取工作區範圍內的論文摘要 - 嚴格工作區隔離
@@ -159,7 +286,7 @@ class UnifiedQueryProcessor:
             selected_papers = await db_service.get_selected_papers_by_workspace(db, workspace_id)
                 
             if not selected_papers:
-                logger.warning(f"工作區 {workspace_id} 中沒有已選取的論文")
+                logger.warning("工作區中沒有已選取的論文", workspace=workspace_id)
                 return []
             
             paper_ids = [str(paper.id) for paper in selected_papers]
@@ -168,20 +295,22 @@ class UnifiedQueryProcessor:
             papers_summary = await db_service.get_papers_with_sections_summary(db, paper_ids)
                         
             # 額外的安全檢查：確保所有論文都屬於指定工作區
+            papers_by_id = {str(paper.id): paper for paper in selected_papers}
+            workspace_str = str(workspace_id)
             verified_summary = []
             for paper_summary in papers_summary:
-                # 通過檔案名在資料庫中驗證工作區歸屬
-                paper = next((p for p in selected_papers if p.file_name == paper_summary.get('file_name')), None)
-                if paper and str(paper.workspace_id) == str(workspace_id):
+                # 以論文ID比對驗證工作區歸屬 (檔名在不同工作區間可能重複)
+                paper = papers_by_id.get(paper_summary.get('paper_id'))
+                if paper and str(paper.workspace_id) == workspace_str:
                     verified_summary.append(paper_summary)
                 else:
-                    logger.warning(f"論文 {paper_summary.get('file_name')} 不屬於工作區 {workspace_id}，已過濾")
+                    logger.warning("論文不屬於工作區，已過濾", workspace=workspace_id, file_name=paper_summary.get('file_name'))
             
-            logger.info(f"工作區 {workspace_id} 中獲取到 {len(verified_summary)} 個論文摘要")
+            logger.info("工作區論文摘要獲取完成", workspace=workspace_id, papers=len(verified_summary))
             return verified_summary
                 
-        except Exception as e:
-            logger.error(f"獲取工作區論文摘要失敗: workspace={workspace_id}, error={str(e)}")
+        except (SQLAlchemyError, asyncio.TimeoutError) as e:
+            logger.error("獲取工作區論文摘要失敗", workspace=workspace_id, error=str(e))
             return []
     
     async def _intelligent_section_selection(
@@ -194,15 +323,16 @@ class UnifiedQueryProcessor:
         智能章節選擇 - 添加工作區上下文
         """
         try:
-            logger.info(f"執行智能章節選擇: workspace={workspace_id}, 論文數={len(papers_summary)}")
-            
-            # 清理 UUID，確保所有內容都可以 JSON 序列化
-            cleaned_papers_summary = convert_uuids_to_strings(papers_summary)
+            logger.info("執行智能章節選擇", workspace=workspace_id, papers=len(papers_summary))
             
-            # 呼叫 N8N 服務
-            selection_result = await n8n_service.intelligent_section_selection(
-                query=query, 
-                available_papers=cleaned_papers_summary
+            # 呼叫 N8N 服務，短時間內相同的請求合併為一次呼叫
+            selection_result = await self._cached_n8n_call(
+                'intelligent_section_selection',
+                _payload_key(query, papers_summary),
+                lambda: self.n8n.intelligent_section_selection(
+                    query=query, 
+                    available_papers=papers_summary
+                )
             )
             
             if "error" in selection_result:
@@ -210,8 +340,10 @@ class UnifiedQueryProcessor:
             
             return selection_result
             
+        except QueryProcessingError:
+            raise
         except Exception as e:
-            logger.error(f"智能章節選擇過程中出錯: {str(e)}")
+            logger.error("智能章節選擇過程中出錯", workspace=workspace_id, error=str(e), exc_info=True)
             raise QueryProcessingError(f"智能章節選擇失敗: {str(e)}")
     
     async def _extract_workspace_content(
@@ -220,147 +352,259 @@ class UnifiedQueryProcessor:
         query: str,
         selected_sections: List[Dict[str, Any]],
         analysis_focus: str,
-        workspace_id: UUID
-    ) -> List[Dict[str, Any]]:
+        workspace_id: UUID,
+        paper_names: Dict[str, str]
+    ) -> List[ContentBlock]:
         """
         從資料庫中提取選定的內容 - 實現穩健的回退機制
         1. 根據 analysis_focus 優先提取特定類型的內容。
         2. 如果特定內容不存在，則回退提取關鍵句子。
         3. 確保為每個選定的章節提供內容，除非該章節完全沒有句子。
+        
+        paper_names 為已驗證屬於工作區的論文 (paper_id -> file_name)，不在其中的章節直接略過
         """
         try:
-            logger.info(f"開始提取工作區內容: workspace={workspace_id}, analysis_focus={analysis_focus}, section_count={len(selected_sections)}")
+            logger.info("開始提取工作區內容", workspace=workspace_id, analysis_focus=analysis_focus, section_count=len(selected_sections))
 
             all_content = []
 
+            valid_sections: List[Tuple[Tuple[str, str], Dict[str, Any]]] = []
+            seen_sections: Set[Tuple[str, str]] = set()
             for section in selected_sections:
-                paper_id = section.get('paper_id')
-                section_name = section.get('section_name')
-
-                if not paper_id or not section_name:
-                    logger.warning(f"跳過無效的選擇章節: {section}")
+                if not section.get('paper_id') or not section.get('section_name'):
+                    logger.debug("跳過無效的選擇章節", section=section)
                     continue
-
-                if not await db_service.is_paper_in_workspace(db, paper_id, workspace_id):
-                    logger.warning(f"Paper {paper_id} not in workspace {workspace_id}, skipping.")
+                if str(section['paper_id']) not in paper_names:
+                    logger.warning("選擇的章節不在工作區論文中，已略過", workspace=workspace_id, paper_id=section['paper_id'])
                     continue
-
-                paper_info = await db_service.get_paper_by_id(db, paper_id)
-                if not paper_info:
-                    logger.warning(f"找不到論文資訊: paper_id={paper_id}")
+                # 重複選擇的同一章節只提取一次
+                section_key = (str(section['paper_id']), section['section_name'].lower())
+                if section_key in seen_sections:
                     continue
-                
-                content_block = {
-                    "paper_name": paper_info.file_name,
-                    "section_type": section_name,
-                }
-                content_found = False
+                seen_sections.add(section_key)
+                valid_sections.append((section_key, section))
 
-                # 1. 根據 analysis_focus 優先提取
-                if analysis_focus == 'definitions':
-                    definitions = await db_service.get_definitions_by_section(db, paper_id, section_name)
-                    if definitions:
-                        content_block["content_type"] = "definitions"
-                        content_block["content"] = [
-                            {"page_num": d.page_num, "text": str(d.text), "type": str(d.definition_type)}
-                            for d in definitions
-                        ]
-                        content_found = True
-                
-                elif analysis_focus == 'methods':
-                    full_section = await db_service.get_full_section_content(db, paper_id, section_name)
-                    if full_section and full_section.get('text'):
-                        content_block["content_type"] = "full_section"
-                        content_block["content"] = str(full_section.get('text', ''))
-                        content_found = True
+            # 優先內容 (定義句子或完整章節) 與回退的關鍵句子各以一次批次查詢涵蓋所有章節，
+            # 取代逐章節最多三次的資料庫往返
+            section_pairs = [(section['paper_id'], section['section_name']) for _, section in valid_sections]
+            priority_map: Dict[Tuple[str, str], Any] = {}
+            if analysis_focus == 'definitions':
+                priority_map = await db_service.get_definitions_by_sections(db, section_pairs)
+            elif analysis_focus == 'methods':
+                priority_map = await db_service.get_full_sections_content(db, section_pairs)
+
+            priority_content = {
+                key: self._priority_content(analysis_focus, priority_map.get(key))
+                for key, _ in valid_sections
+            }
 
-                # 2. 如果優先內容未找到，回退到提取關鍵句子
-                if not content_found:
-                    # 'locate_info', 'understand_content', etc. 也使用此邏輯
-                    sentences = await db_service.get_top_k_sentences_by_section(db, paper_id, section_name, k=5)
-                    if sentences:
-                        content_block["content_type"] = "key_sentences"
-                        content_block["content"] = [
-                            {"page_num": s.page_num, "sentence_text": str(s.sentence)}
-                            for s in sentences
-                        ]
-                        content_found = True
+            # 優先內容未找到的章節回退到關鍵句子 ('locate_info', 'understand_content' 等也使用此邏輯)
+            fallback_pairs = [
+                (section['paper_id'], section['section_name'])
+                for key, section in valid_sections if priority_content[key] is None
+            ]
+            sentences_map = {}
+            if fallback_pairs:
+                sentences_map = await db_service.get_top_k_sentences_by_sections(db, fallback_pairs, k=5)
 
-                # 3. 如果找到了任何類型的內容，則添加到最終列表中
-                if content_found:
-                    all_content.append(content_block)
-                else:
-                    logger.warning(f"無法為章節提取任何內容: paper_id={paper_id}, section={section_name}")
+            for key, section in valid_sections:
+                content = priority_content[key]
+                if content is None and sentences_map.get(key):
+                    content = ("key_sentences", [
+                        {"page_num": s.page_num, "sentence_text": s.sentence}
+                        for s in sentences_map[key]
+                    ])
+                if content is None:
+                    logger.debug("無法為章節提取任何內容", paper_id=section['paper_id'], section=section['section_name'])
+                    continue
+                all_content.append(ContentBlock(
+                    paper_name=paper_names[key[0]],
+                    section_type=section['section_name'],
+                    content_type=content[0],
+                    content=content[1]
+                ))
 
-            logger.info(f"工作區內容提取完成: workspace={workspace_id}, 提取到 {len(all_content)} 項內容")
+            logger.info("工作區內容提取完成", workspace=workspace_id, content_count=len(all_content))
             return all_content
 
-        except Exception as e:
-            logger.error(f"提取工作區內容時出錯: workspace={workspace_id}, error={str(e)}")
+        except (SQLAlchemyError, asyncio.TimeoutError) as e:
+            logger.error("提取工作區內容時出錯", workspace=workspace_id, error=str(e))
             return []
+
+    def _priority_content(self, analysis_focus: str, priority: Any) -> Optional[Tuple[str, Any]]:
+        """
+        依 analysis_focus 將預先查詢的優先內容轉為 (content_type, content)，無可用內容時返回 None
+        """
+        if analysis_focus == 'definitions' and priority:
+            return "definitions", [
+                {"page_num": d.page_num, "text": d.text, "type": d.definition_type}
+                for d in priority
+            ]
+        if analysis_focus == 'methods' and priority and priority.get('text'):
+            return "full_section", priority['text']
+        return None
     
     async def _unified_content_analysis(
         self, 
         query: str, 
-        selected_content: List[Dict[str, Any]], 
+        selected_content: List[ContentBlock], 
         section_selection: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
         統一內容分析 - 調用N8N工作流程
         """
+        if not selected_content:
+            # 沒有可分析的內容時不呼叫 N8N，直接返回與分析結果相同格式的回應
+            logger.info("沒有可分析的章節內容，略過統一內容分析")
+            return {
+                'query': query,
+                'response': "在選定的章節中找不到與查詢相關的內容",
+                'references': [],
+                'source_summary': {
+                    'total_papers': 0,
+                    'papers_used': [],
+                    'error_occurred': False,
+                    # 標記為未經 N8N 分析的回應，呼叫端據此略過快取與成功指標
+                    'no_content': True
+                }
+            }
+        
         try:
-            logger.info(f"統一內容分析啟動，選擇內容數: {len(selected_content)}")
-            
-            # 清理 UUID
-            cleaned_content = convert_uuids_to_strings(selected_content)
+            logger.info("統一內容分析啟動", selected_content=len(selected_content))
             
             # 從 section_selection 中獲取 analysis_focus
             analysis_focus = section_selection.get('analysis_focus', 'definitions')
 
-            analysis_result = await n8n_service.unified_content_analysis(
-                query=query,
-                selected_content=cleaned_content,
-                analysis_focus=analysis_focus
+            analysis_result = await self._cached_n8n_call(
+                'unified_content_analysis',
+                _payload_key(query, selected_content, analysis_focus),
+                lambda: self.n8n.unified_content_analysis(
+                    query=query,
+                    selected_content=selected_content,
+                    analysis_focus=analysis_focus
+                )
             )
+            
+            if "error" in analysis_result:
+                raise QueryProcessingError(f"統一內容分析失敗: {analysis_result['error']}")
+            
             return analysis_result
             
+        except QueryProcessingError:
+            raise
         except Exception as e:
-            logger.error(f"統一內容分析失敗: {str(e)}")
+            logger.error("統一內容分析失敗", error=str(e), exc_info=True)
             raise QueryProcessingError(f"統一內容分析過程中出錯: {e}")
     
+    async def _cached_n8n_call(
+        self,
+        name: str,
+        key: str,
+        call: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        以快取包裝 N8N 呼叫：命中時直接返回；相同請求進行中時共用同一次呼叫，
+        否則發出呼叫並存入成功的結果
+        """
+        cached = self._n8n_cache.get('POST', name, data={'key': key})
+        if cached is not None:
+            logger.info("N8N 快取命中", endpoint=name)
+            return dict(cached)
+
+        inflight_key = f"{name}:{key}"
+        pending = self._inflight.get(inflight_key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._call_and_cache(name, key, call))
+            self._inflight[inflight_key] = pending
+            pending.add_done_callback(lambda _: self._inflight.pop(inflight_key, None))
+        else:
+            logger.info("合併進行中的 N8N 請求", endpoint=name)
+
+        # shield 避免單一呼叫端取消時連帶取消其他等待者共用的請求
+        result = await asyncio.shield(pending)
+        return dict(result)
+
+    async def _call_and_cache(
+        self,
+        name: str,
+        key: str,
+        call: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """發出 N8N 呼叫，僅快取成功的結果"""
+        result = await call()
+        if "error" not in result:
+            # 存入副本，避免呼叫端附加的欄位寫回快取
+            self._n8n_cache.set('POST', name, dict(result), request_data={'key': key})
+        return result
+    
     def get_processing_stats(self) -> Dict[str, Any]:
         """獲取處理統計數據"""
-        return self.processing_stats.copy()
+        return {
+            'total_queries': self._total_queries,
+            'successful_queries': self._successful_queries,
+            'failed_queries': self._failed_queries,
+            'average_processing_time': (
+                self._processing_time_sum / self._successful_queries if self._successful_queries else 0.0
+            ),
+            **self._processing_time_percentiles()
+        }
+
+    def _processing_time_percentiles(self) -> Dict[str, float]:
+        """以最近的處理時間計算 p50/p95，讀取時才排序"""
+        recent = sorted(self._recent_processing_times)
+        if not recent:
+            return {'p50_processing_time': 0.0, 'p95_processing_time': 0.0}
+        last = len(recent) - 1
+        return {
+            'p50_processing_time': recent[round(last * 0.50)],
+            'p95_processing_time': recent[round(last * 0.95)]
+        }
     
     async def health_check(self) -> Dict[str, Any]:
-        """健康檢查"""
+        """健康檢查，結果短暫快取以吸收存活探測的頻繁輪詢"""
+        if self._health_cache is not None and self._health_cache[0] > time.monotonic():
+            return self._health_cache[1]
+        
         try:
-            # 檢查N8N服務狀態
-            try:
-                n8n_health = await n8n_service.health_check()
-                n8n_status = n8n_health.get('overall_healthy', False)
-            except Exception as e:
+            # 各項子檢查互不相依，並行執行
+            n8n_health, db_health = await asyncio.gather(
+                self.n8n.health_check(), self._check_database(), return_exceptions=True
+            )
+            
+            if isinstance(n8n_health, Exception):
                 n8n_status = False
-                logger.warning(f"N8N服務健康檢查失敗: {e}")
+                logger.warning("N8N服務健康檢查失敗", error=str(n8n_health))
+            else:
+                n8n_status = n8n_health.get('overall_healthy', False)
             
-            # 檢查資料庫連接 (簡化檢查)
-            db_status = True  # 簡化為預設健康
+            if isinstance(db_health, Exception):
+                db_status = False
+                logger.warning("資料庫健康檢查失敗", error=str(db_health))
+            else:
+                db_status = True
             
-            return {
+            health = {
                 'unified_query_processor': True,
                 'n8n_service': n8n_status,
                 'database_service': db_status,
-                'processing_stats': self.processing_stats,
+                'processing_stats': self.get_processing_stats(),
                 'timestamp': datetime.now().isoformat()
             }
+            self._health_cache = (time.monotonic() + self.HEALTH_CHECK_TTL_SECONDS, health)
+            return health
             
         except Exception as e:
-            logger.error(f"健康檢查失敗: {e}")
+            logger.error("健康檢查失敗", error=str(e))
             return {
                 'unified_query_processor': False,
                 'error': str(e),
                 'timestamp': datetime.now().isoformat()
             }
 
+    async def _check_database(self):
+        """以獨立會話執行最簡查詢確認資料庫連線"""
+        async with AsyncSessionLocal() as session:
+            await session.execute(text("SELECT 1"))
+
 # 全域實例
 unified_query_processor = UnifiedQueryProcessor() 
\ No newline at end of file